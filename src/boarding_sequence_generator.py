@@ -5,14 +5,163 @@ This module generates optimal boarding sequences for bus passengers
 to minimize boarding time with a single front entry point.
 """
 
+import csv
+import heapq
+import io
+import itertools
+import os
 import re
+import sys
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Tuple, Dict
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
 
-@dataclass
+# Optional Numba kernel for the large-batch ordering. The packed
+# (neg_dist, id) int64 key makes the whole lexsort a single argsort
+# that runs in compiled code and releases the GIL.
+_compiled_lexsort = None
+if np is not None:
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover - Numba is optional
+        njit = None
+
+    if njit is not None:
+        @njit(cache=True)
+        def _compiled_lexsort(ids, neg_dists):  # pragma: no cover
+            n = ids.shape[0]
+            keys = np.empty(n, dtype=np.int64)
+            for i in range(n):
+                keys[i] = (np.int64(neg_dists[i]) << 32) | np.int64(ids[i])
+            return np.argsort(keys, kind='mergesort')
+
+# Booking counts below this stay on the pure-Python sort; NumPy's
+# array-construction overhead only pays off for larger batches.
+_NUMPY_SORT_THRESHOLD = 256
+
+# Counting sort over distance buckets is used while the furthest row
+# stays at most this; beyond it the bucket table would outgrow the
+# input and Timsort wins.
+_COUNTING_SORT_MAX_DIST = 512
+
+# Files smaller than this parse faster sequentially than the cost of
+# spinning up worker processes.
+_PARALLEL_MIN_BYTES = 1 << 20
+
+# Precompiled once at import time so the hot parsing path skips the
+# regex-cache lookup that re.search() performs on every call.
+_DIGIT_RE = re.compile(r'(\d+)')
+
+
+@lru_cache(maxsize=4096)
+def _seat_distance(seat: str) -> int:
+    """
+    Distance from the front entry for a single seat label.
+
+    A bus has only a few hundred distinct labels, so identical labels
+    recur constantly across a booking file; the cache turns repeat
+    parses into a dict lookup.
+    """
+    # Fast path for the common 'A12' shape: letter prefix + digits.
+    if seat and seat[0].isalpha():
+        rest = seat[1:]
+        if rest.isdigit():
+            return int(rest)
+
+    # Extract row number from seat (e.g., 'A20' -> 20, 'C2' -> 2)
+    match = _DIGIT_RE.search(seat)
+    if match:
+        return int(match.group(1))
+    return 0
+
+
+def _parse_seat_field(seats_field: str) -> Tuple[List[str], int]:
+    """
+    Split a comma-separated seat field into labels and the furthest
+    distance.
+
+    Row numbers come from one finditer sweep over the whole field, so
+    the regex engine starts once per booking instead of once per seat.
+    """
+    # A bus has only a few hundred distinct labels; interning makes
+    # every duplicate share one string object, so string memory stays
+    # O(distinct labels) no matter how large the file is.
+    seats = [sys.intern(raw.strip()) for raw in seats_field.split(',')]
+    min_distance = max(
+        (int(match.group()) for match in _DIGIT_RE.finditer(seats_field)),
+        default=0
+    )
+    return seats, min_distance
+
+
+def _parse_chunk(file_path: str, start: int, end: int) -> Tuple[List[int], List[int], List[List[str]]]:
+    """
+    Parse the byte range [start, end) of a booking file in a worker
+    process. A chunk owns every line that begins inside its range, so
+    chunks re-align to the next newline and never split a row.
+    """
+    ids: List[int] = []
+    dists: List[int] = []
+    seats_rows: List[List[str]] = []
+
+    with open(file_path, 'rb') as file:
+        if start:
+            # Peek at the byte before the range: if it is a newline,
+            # this chunk begins exactly on a line start and owns that
+            # line (the previous chunk's loop stops short of it);
+            # otherwise the partial line belongs to the previous chunk.
+            file.seek(start - 1)
+            if file.read(1) != b'\n':
+                file.readline()
+        else:
+            file.seek(start)
+            # Skip header if present
+            pos = file.tell()
+            line = file.readline()
+            if b'Booking_ID' not in line:
+                file.seek(pos)
+
+        while file.tell() < end:
+            line = file.readline()
+            if not line:
+                break
+            text = line.decode('utf-8').strip()
+            if not text:
+                continue
+            parts = text.split('\t')
+            if len(parts) >= 2 and parts[0].strip():
+                booking_id = int(parts[0])
+                seats, min_distance = _parse_seat_field(parts[1])
+                ids.append(booking_id)
+                dists.append(min_distance)
+                seats_rows.append(seats)
+
+    return ids, dists, seats_rows
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters in the
+# CI matrix still get a frozen dataclass, just with a __dict__.
+_DATACLASS_KWARGS = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_KWARGS['slots'] = True
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class Booking:
-    """Represents a booking with ID and seat assignments."""
+    """
+    Represents a booking with ID and seat assignments.
+
+    Slots drop the per-instance __dict__ (~100 bytes per booking) and
+    make attribute reads during sorting a fixed-offset lookup.
+    """
     booking_id: int
     seats: List[str]
     min_distance: int = 0
@@ -28,8 +177,23 @@ class BusBoardingSequenceGenerator:
     
     def __init__(self):
         """Initialize the boarding sequence generator."""
-        self.bookings: List[Booking] = []
-    
+        # Bookings are stored struct-of-arrays style: two contiguous
+        # int buffers for the sort keys plus a parallel seats list.
+        # The hot sort path then touches only the int buffers instead
+        # of chasing Booking objects across the heap.
+        self._reset()
+
+    @property
+    def bookings(self) -> List[Booking]:
+        """Loaded bookings as Booking objects (built lazily)."""
+        if self._bookings_cache is None:
+            self._bookings_cache = [
+                Booking(booking_id, seats, min_distance)
+                for booking_id, seats, min_distance
+                in zip(self._ids, self._seats, self._dists)
+            ]
+        return self._bookings_cache
+
     def parse_seat_distance(self, seat: str) -> int:
         """
         Calculate distance from front entry based on seat label.
@@ -40,12 +204,31 @@ class BusBoardingSequenceGenerator:
         Returns:
             Distance from front entry (higher number = further from front)
         """
-        # Extract row number from seat (e.g., 'A20' -> 20, 'C2' -> 2)
-        match = re.search(r'(\d+)', seat)
-        if match:
-            return int(match.group(1))
-        return 0
-    
+        return _seat_distance(seat)
+
+    def _reset(self) -> None:
+        """Clear loaded bookings and drop any memoized results."""
+        self._ids = array('i')
+        self._dists = array('i')
+        # Distances negated once at load so descending order falls out
+        # of plain ascending comparisons.
+        self._neg_dists = array('i')
+        self._seats: List[List[str]] = []
+        # Row indices grouped by distance as they are parsed, so
+        # sequence generation only has to emit buckets far-to-near.
+        self._dist_buckets = defaultdict(list)
+        self._seq_cache = None
+        self._order_cache = None
+        self._bookings_cache = None
+
+    def _append(self, booking_id: int, seats: List[str], min_distance: int) -> None:
+        """Append one parsed booking to the parallel arrays."""
+        self._dist_buckets[min_distance].append(len(self._ids))
+        self._ids.append(booking_id)
+        self._dists.append(min_distance)
+        self._neg_dists.append(-min_distance)
+        self._seats.append(seats)
+
     def load_bookings_from_file(self, file_path: str) -> None:
         """
         Load booking data from file.
@@ -53,36 +236,101 @@ class BusBoardingSequenceGenerator:
         Args:
             file_path: Path to the booking data file
         """
-        self.bookings = []
-        
+        self._reset()
+
         try:
-            with open(file_path, 'r') as file:
-                lines = file.readlines()
-                
-                # Skip header if present
-                start_idx = 1 if lines and 'Booking_ID' in lines[0] else 0
-                
-                for line in lines[start_idx:]:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    parts = line.split('\t')
-                    if len(parts) >= 2:
-                        booking_id = int(parts[0])
-                        seats = [seat.strip() for seat in parts[1].split(',')]
-                        
-                        # Calculate minimum distance (furthest seat from front)
-                        distances = [self.parse_seat_distance(seat) for seat in seats]
-                        min_distance = max(distances) if distances else 0
-                        
-                        booking = Booking(booking_id, seats, min_distance)
-                        self.bookings.append(booking)
-                        
+            with open(file_path, 'r', newline='') as file:
+                self._parse_rows(csv.reader(file, delimiter='\t'))
+
         except FileNotFoundError:
             raise FileNotFoundError(f"Booking file not found: {file_path}")
         except Exception as e:
             raise Exception(f"Error reading booking file: {str(e)}")
+
+    def load_bookings_from_file_parallel(self, file_path: str, workers: int = 4) -> None:
+        """
+        Load booking data from a large file using worker processes.
+
+        The file is split into row-aligned byte chunks parsed in a
+        ProcessPoolExecutor; results are concatenated in file order.
+        Small files fall back to the sequential loader, which wins
+        below the process start-up cost.
+
+        Args:
+            file_path: Path to the booking data file
+            workers: Number of worker processes to use
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Booking file not found: {file_path}")
+
+        size = os.path.getsize(file_path)
+        if workers <= 1 or size < _PARALLEL_MIN_BYTES:
+            self.load_bookings_from_file(file_path)
+            return
+
+        self._reset()
+
+        bounds = [size * i // workers for i in range(workers + 1)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunks = pool.map(
+                    _parse_chunk,
+                    itertools.repeat(file_path),
+                    bounds[:-1],
+                    bounds[1:]
+                )
+                for ids, dists, seats_rows in chunks:
+                    base = len(self._ids)
+                    for offset, dist in enumerate(dists):
+                        self._dist_buckets[dist].append(base + offset)
+                    self._ids.extend(ids)
+                    self._dists.extend(dists)
+                    self._neg_dists.extend(-d for d in dists)
+                    self._seats.extend(seats_rows)
+        except Exception as e:
+            raise Exception(f"Error reading booking file: {str(e)}")
+
+    def load_bookings_from_stream(self, stream) -> None:
+        """
+        Load booking data directly from an open file-like object.
+
+        Lets callers (e.g. the web upload handler) feed bytes straight
+        from the request without a temp-file round-trip.
+
+        Args:
+            stream: Binary or text file object with booking rows
+        """
+        self._reset()
+
+        wrapped = None
+        if not isinstance(stream, io.TextIOBase):
+            wrapped = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+            stream = wrapped
+
+        try:
+            self._parse_rows(csv.reader(stream, delimiter='\t'))
+        finally:
+            if wrapped is not None:
+                # Hand the underlying stream back to the caller open.
+                wrapped.detach()
+
+    def _parse_rows(self, reader) -> None:
+        """Parse tab-separated rows into the booking arrays."""
+        # csv.reader streams rows through its C tokenizer, so the
+        # input is never materialized as a line list.
+
+        # Skip header if present
+        first = next(reader, None)
+        if first is None:
+            return
+        rows = reader if first and 'Booking_ID' in first[0] \
+            else itertools.chain([first], reader)
+
+        for row in rows:
+            if len(row) >= 2 and row[0].strip():
+                booking_id = int(row[0])
+                seats, min_distance = _parse_seat_field(row[1])
+                self._append(booking_id, seats, min_distance)
     
     def load_bookings_from_data(self, booking_data: List[Tuple[int, str]]) -> None:
         """
@@ -91,18 +339,12 @@ class BusBoardingSequenceGenerator:
         Args:
             booking_data: List of (booking_id, seats_string) tuples
         """
-        self.bookings = []
-        
+        self._reset()
+
         for booking_id, seats_string in booking_data:
-            seats = [seat.strip() for seat in seats_string.split(',')]
-            
-            # Calculate minimum distance (furthest seat from front)
-            distances = [self.parse_seat_distance(seat) for seat in seats]
-            min_distance = max(distances) if distances else 0
-            
-            booking = Booking(booking_id, seats, min_distance)
-            self.bookings.append(booking)
-    
+            seats, min_distance = _parse_seat_field(seats_string)
+            self._append(booking_id, seats, min_distance)
+
     def generate_boarding_sequence(self) -> List[Tuple[int, int]]:
         """
         Generate optimal boarding sequence.
@@ -110,22 +352,104 @@ class BusBoardingSequenceGenerator:
         Returns:
             List of (sequence_number, booking_id) tuples
         """
-        if not self.bookings:
+        if self._seq_cache is not None:
+            return self._seq_cache
+
+        n = len(self._ids)
+        if n == 0:
             return []
-        
-        # Sort by distance (descending) then by booking_id (ascending) for ties
-        sorted_bookings = sorted(
-            self.bookings,
-            key=lambda x: (-x.min_distance, x.booking_id)
-        )
-        
-        # Generate sequence
-        sequence = []
-        for i, booking in enumerate(sorted_bookings, 1):
-            sequence.append((i, booking.booking_id))
-        
+
+        order = self._boarding_order()
+        ids = self._ids
+        sequence = [(i, ids[idx]) for i, idx in enumerate(order, 1)]
+
+        self._order_cache = order
+        self._seq_cache = sequence
         return sequence
+
+    def _boarding_order(self) -> List[int]:
+        """
+        Row indices in boarding order: distance descending, then
+        booking_id ascending for ties.
+        """
+        # Large batches: sort the two int buffers in C via lexsort
+        # instead of running N log N Python-level key comparisons.
+        if np is not None and len(self._ids) > _NUMPY_SORT_THRESHOLD:
+            ids = np.frombuffer(self._ids, dtype=np.intc)
+            neg_dists = np.frombuffer(self._neg_dists, dtype=np.intc)
+            if _compiled_lexsort is not None:
+                return _compiled_lexsort(ids, neg_dists).tolist()
+            return np.lexsort((ids, neg_dists)).tolist()
+
+        ids = self._ids
+        dists = self._dists
+
+        # Bus rows are small bounded ints, so a greedy far-to-near
+        # sweep over the parse-time distance buckets beats a
+        # comparison sort: O(n + max_dist) with no per-comparison key
+        # lambdas, and the grouping work is already done.
+        buckets = self._dist_buckets
+        max_dist = max(buckets)
+        if max_dist <= _COUNTING_SORT_MAX_DIST:
+            order = []
+            for dist in range(max_dist, -1, -1):
+                bucket = buckets.get(dist)
+                if bucket:
+                    bucket.sort(key=ids.__getitem__)
+                    order.extend(bucket)
+            return order
+
+        # Two stable single-key sorts: id ascending, then negated
+        # distance ascending. Timsort's stability keeps ids ordered
+        # within equal distances, and each pass extracts one int key
+        # per row via a C method instead of allocating a tuple per row.
+        order = sorted(range(len(ids)), key=ids.__getitem__)
+        order.sort(key=self._neg_dists.__getitem__)
+        return order
     
+    def top_k(self, k: int) -> List[Tuple[int, int]]:
+        """
+        First k entries of the boarding sequence without a full sort.
+
+        Uses a size-k heap selection, O(n log k) instead of the
+        O(n log n) full ordering - useful when only the first boarding
+        group is needed.
+
+        Args:
+            k: Number of leading sequence entries to return
+
+        Returns:
+            List of (sequence_number, booking_id) tuples
+        """
+        if self._seq_cache is not None:
+            return self._seq_cache[:k]
+
+        ids = self._ids
+        dists = self._dists
+        order = heapq.nsmallest(
+            k, range(len(ids)), key=lambda i: (-dists[i], ids[i])
+        )
+        return [(i, ids[idx]) for i, idx in enumerate(order, 1)]
+
+    def iter_sequence(self):
+        """
+        Yield (sequence_number, booking_id) pairs lazily.
+
+        Builds a heap in O(n) and pops entries on demand, so callers
+        that stop early never pay for ordering the full tail.
+        """
+        heap = [
+            (-min_distance, booking_id)
+            for booking_id, min_distance in zip(self._ids, self._dists)
+        ]
+        heapq.heapify(heap)
+
+        seq_num = 0
+        while heap:
+            _, booking_id = heapq.heappop(heap)
+            seq_num += 1
+            yield (seq_num, booking_id)
+
     def get_boarding_details(self) -> List[Dict]:
         """
         Get detailed boarding information for analysis.
@@ -133,21 +457,24 @@ class BusBoardingSequenceGenerator:
         Returns:
             List of dictionaries with booking details
         """
-        sequence = self.generate_boarding_sequence()
-        details = []
-        
-        booking_dict = {b.booking_id: b for b in self.bookings}
-        
-        for seq_num, booking_id in sequence:
-            booking = booking_dict[booking_id]
-            details.append({
+        self.generate_boarding_sequence()
+        if self._order_cache is None:
+            return []
+
+        # The cached boarding order already indexes the row arrays, so
+        # details come from a direct gather - no id dict round-trip.
+        ids = self._ids
+        seats = self._seats
+        dists = self._dists
+        return [
+            {
                 'sequence': seq_num,
-                'booking_id': booking_id,
-                'seats': booking.seats,
-                'furthest_seat_distance': booking.min_distance
-            })
-        
-        return details
+                'booking_id': ids[idx],
+                'seats': seats[idx],
+                'furthest_seat_distance': dists[idx]
+            }
+            for seq_num, idx in enumerate(self._order_cache, 1)
+        ]
     
     def print_boarding_sequence(self) -> None:
         """Print the boarding sequence in UI-friendly format."""
@@ -155,8 +482,10 @@ class BusBoardingSequenceGenerator:
         
         print("Seq   Booking_ID")
         print("-" * 15)
-        for seq_num, booking_id in sequence:
-            print(f"{seq_num:<5} {booking_id}")
+        if sequence:
+            print('\n'.join(
+                f"{seq_num:<5} {booking_id}" for seq_num, booking_id in sequence
+            ))
     
     def export_to_file(self, output_path: str) -> None:
         """
@@ -166,11 +495,14 @@ class BusBoardingSequenceGenerator:
             output_path: Path for output file
         """
         sequence = self.generate_boarding_sequence()
-        
+
+        # Assemble the payload first and write it in one call instead
+        # of crossing the Python/C write boundary once per row.
+        lines = ["Seq\tBooking_ID\n"]
+        lines.extend(f"{seq_num}\t{booking_id}\n" for seq_num, booking_id in sequence)
+
         with open(output_path, 'w') as file:
-            file.write("Seq\tBooking_ID\n")
-            for seq_num, booking_id in sequence:
-                file.write(f"{seq_num}\t{booking_id}\n")
+            file.write(''.join(lines))
 
 
 def main():
@@ -4,7 +4,9 @@ Unit tests for Bus Boarding Sequence Generator
 
 import unittest
 import tempfile
+import io
 import os
+import random
 import sys
 
 # Add src directory to path
@@ -107,6 +109,34 @@ class TestBoardingSequenceGenerator(unittest.TestCase):
         finally:
             os.unlink(temp_file_path)
     
+    def test_load_bookings_from_stream(self):
+        """Test loading bookings from a binary stream."""
+        stream = io.BytesIO(
+            b"Booking_ID\tSeats\n"
+            b"101\tA1,B1\n"
+            b"120\tA20,C2\n"
+            b"105\tA15,B15\n"
+        )
+
+        self.generator.load_bookings_from_stream(stream)
+
+        self.assertEqual(len(self.generator.bookings), 3)
+
+        booking_ids = [b.booking_id for b in self.generator.bookings]
+        self.assertIn(101, booking_ids)
+        self.assertIn(120, booking_ids)
+        self.assertIn(105, booking_ids)
+
+        # Stream should be handed back open for the caller
+        self.assertFalse(stream.closed)
+
+    def test_load_bookings_from_stream_text_no_header(self):
+        """Test loading bookings from a text stream without header."""
+        stream = io.StringIO("101\tA1,B1\n120\tA20,C2\n")
+
+        self.generator.load_bookings_from_stream(stream)
+        self.assertEqual(len(self.generator.bookings), 2)
+
     def test_load_bookings_file_not_found(self):
         """Test loading from non-existent file."""
         with self.assertRaises(FileNotFoundError):
@@ -172,6 +202,44 @@ class TestBoardingSequenceGenerator(unittest.TestCase):
         sequence = self.generator.generate_boarding_sequence()
         self.assertEqual(sequence, [])
     
+    def test_top_k_matches_full_sequence(self):
+        """Test that top_k returns the head of the full sequence."""
+        booking_data = [
+            (105, "A10,B10"),
+            (101, "A10,C10"),
+            (120, "A20,C2"),
+            (130, "B5"),
+        ]
+
+        self.generator.load_bookings_from_data(booking_data)
+        expected = [(1, 120), (2, 101), (3, 105), (4, 130)]
+
+        # Uncached path: heap selection before any full sort
+        self.assertEqual(self.generator.top_k(2), expected[:2])
+
+        sequence = self.generator.generate_boarding_sequence()
+        self.assertEqual(sequence, expected)
+
+        # Cached path: served as a slice of the memoized sequence
+        for k in range(len(booking_data) + 2):
+            with self.subTest(k=k):
+                self.assertEqual(self.generator.top_k(k), sequence[:k])
+
+    def test_iter_sequence_matches_full_sequence(self):
+        """Test that iter_sequence yields the full sequence lazily."""
+        booking_data = [
+            (105, "A10,B10"),
+            (101, "A10,C10"),
+            (120, "A20,C2"),
+        ]
+
+        self.generator.load_bookings_from_data(booking_data)
+
+        self.assertEqual(
+            list(self.generator.iter_sequence()),
+            self.generator.generate_boarding_sequence()
+        )
+
     def test_get_boarding_details(self):
         """Test getting detailed boarding information."""
         booking_data = [
@@ -263,7 +331,45 @@ class TestBoardingSequenceGenerator(unittest.TestCase):
 
 class TestIntegration(unittest.TestCase):
     """Integration tests."""
-    
+
+    def test_parallel_loader_matches_sequential(self):
+        """Test the parallel loader against the sequential one on a large file."""
+        rng = random.Random(42)
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as temp_file:
+            temp_file.write("Booking_ID\tSeats\n")
+            for i in range(1, 80001):
+                seats = ",".join(
+                    f"{rng.choice('ABCD')}{rng.randint(1, 40)}"
+                    for _ in range(rng.randint(1, 3))
+                )
+                temp_file.write(f"{i}\t{seats}\n")
+            temp_file_path = temp_file.name
+
+        try:
+            # Large enough that the parallel path actually engages
+            self.assertGreater(os.path.getsize(temp_file_path), 1 << 20)
+
+            sequential = BusBoardingSequenceGenerator()
+            sequential.load_bookings_from_file(temp_file_path)
+
+            parallel = BusBoardingSequenceGenerator()
+            parallel.load_bookings_from_file_parallel(temp_file_path, workers=4)
+
+            self.assertEqual(len(parallel.bookings), 80000)
+            self.assertEqual(parallel.bookings, sequential.bookings)
+            self.assertEqual(
+                parallel.generate_boarding_sequence(),
+                sequential.generate_boarding_sequence()
+            )
+            self.assertEqual(
+                parallel.get_boarding_details(),
+                sequential.get_boarding_details()
+            )
+
+        finally:
+            os.unlink(temp_file_path)
+
     def test_end_to_end_file_processing(self):
         """Test complete file processing workflow."""
         # Create test file
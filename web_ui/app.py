@@ -2,11 +2,13 @@
 Flask Web Application for Bus Boarding Sequence Generator
 """
 
+import hashlib
+import io
 import os
 import sys
+from collections import OrderedDict
 from flask import Flask, render_template, request, jsonify, send_file
 from werkzeug.utils import secure_filename
-import tempfile
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -17,6 +19,13 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
 ALLOWED_EXTENSIONS = {'txt', 'csv', 'tsv'}
 
+# Recent upload results keyed by content digest, so re-submitting the
+# same file skips parsing and sorting entirely. The module-level
+# seat-distance cache in the generator already stays warm across
+# requests; this extends that to whole files.
+_RESULT_CACHE_SIZE = 32
+_result_cache = OrderedDict()
+
 
 def allowed_file(filename):
     """Check if file extension is allowed."""
@@ -24,6 +33,28 @@ def allowed_file(filename):
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def _results_for_upload(content):
+    """Return (sequence, details) for uploaded bytes, memoized by digest."""
+    digest = hashlib.blake2b(content, digest_size=16).digest()
+
+    cached = _result_cache.get(digest)
+    if cached is not None:
+        _result_cache.move_to_end(digest)
+        return cached
+
+    generator = BusBoardingSequenceGenerator()
+    generator.load_bookings_from_stream(io.BytesIO(content))
+    result = (
+        generator.generate_boarding_sequence(),
+        generator.get_boarding_details()
+    )
+
+    _result_cache[digest] = result
+    if len(_result_cache) > _RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+    return result
+
+
 @app.route('/')
 def index():
     """Main page with file upload and manual input options."""
@@ -34,45 +65,35 @@ def index():
 def generate_sequence():
     """Generate boarding sequence from uploaded file or manual input."""
     try:
-        generator = BusBoardingSequenceGenerator()
-        
         # Check if file was uploaded
         if 'file' in request.files and request.files['file'].filename:
             file = request.files['file']
-            
+
             if file and allowed_file(file.filename):
-                # Save uploaded file temporarily
-                with tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.txt') as temp_file:
-                    content = file.read().decode('utf-8')
-                    temp_file.write(content)
-                    temp_file_path = temp_file.name
-                
-                try:
-                    generator.load_bookings_from_file(temp_file_path)
-                finally:
-                    os.unlink(temp_file_path)  # Clean up temp file
+                # Memoized by content digest; identical re-uploads
+                # are served from the warm cache without re-parsing
+                sequence, details = _results_for_upload(file.stream.read())
             else:
                 return jsonify({'error': 'Invalid file type. Please upload .txt, .csv, or .tsv files.'}), 400
-        
+
         # Check for manual input
         elif 'manual_data' in request.json:
             manual_data = request.json['manual_data']
             booking_data = []
-            
+
             for entry in manual_data:
                 booking_id = int(entry['booking_id'])
                 seats = entry['seats']
                 booking_data.append((booking_id, seats))
-            
+
+            generator = BusBoardingSequenceGenerator()
             generator.load_bookings_from_data(booking_data)
-        
+            sequence = generator.generate_boarding_sequence()
+            details = generator.get_boarding_details()
+
         else:
             return jsonify({'error': 'No data provided. Please upload a file or enter manual data.'}), 400
-        
-        # Generate sequence and details
-        sequence = generator.generate_boarding_sequence()
-        details = generator.get_boarding_details()
-        
+
         return jsonify({
             'success': True,
             'sequence': sequence,
@@ -91,15 +112,13 @@ def export_sequence():
         data = request.json
         sequence = data.get('sequence', [])
         
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as temp_file:
-            temp_file.write("Seq\tBooking_ID\n")
-            for seq_num, booking_id in sequence:
-                temp_file.write(f"{seq_num}\t{booking_id}\n")
-            temp_file_path = temp_file.name
-        
+        # Build the payload in memory; no tempfile round-trip or cleanup
+        lines = ["Seq\tBooking_ID\n"]
+        lines.extend(f"{seq_num}\t{booking_id}\n" for seq_num, booking_id in sequence)
+
+        buf = io.BytesIO(''.join(lines).encode('utf-8'))
         return send_file(
-            temp_file_path,
+            buf,
             as_attachment=True,
             download_name='boarding_sequence.txt',
             mimetype='text/plain'